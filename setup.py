@@ -93,7 +93,13 @@ setup(
         "receiver": [
             "pathlib2; python_version<'3.4'",
         ],
-        "control_client": []
+        "control_client": [],
+        "compression": [
+            "blosc",
+        ],
+        "speedups": [
+            "orjson; python_version>='3.6'",
+        ],
     },
     entry_points={
         # TODO only installed if corresponding extras is installed
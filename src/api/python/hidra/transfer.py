@@ -31,7 +31,6 @@ from __future__ import unicode_literals
 # requires dependency on future
 from builtins import super  # pylint: disable=redefined-builtin
 
-import copy
 from distutils.version import LooseVersion
 import errno
 import json
@@ -45,13 +44,30 @@ import sys
 import tempfile
 import time
 import zmq
-from zmq.auth.thread import ThreadAuthenticator
 
 try:
     from pathlib import Path
 except ImportError:
     from pathlib2 import Path
 
+try:
+    _monotonic = time.monotonic
+except AttributeError:
+    # python 2
+    _monotonic = time.time
+
+try:
+    # optional, only needed for compressed payloads
+    import blosc
+except ImportError:
+    blosc = None
+
+try:
+    # optional, faster json encoding
+    import orjson
+except ImportError:
+    orjson = None
+
 from .utils._version import __version__
 from . import utils
 from .utils import (
@@ -62,13 +78,169 @@ from .utils import (
     VersionError,
     AuthenticationFailed,
     CommunicationFailed,
+    DataError,
     DataSavingError,
     LoggingFunction,
     Base,
+    get_fqdn,
     get_logger
 )
 from .control import Control
 
+# headers of the NEXUS signal messages sent on the data socket
+_ALIVE_TEST = b"ALIVE_TEST"
+_CLOSE_FILE = b"CLOSE_FILE"
+_SIGNAL_HEADERS = frozenset([_ALIVE_TEST, _CLOSE_FILE])
+
+# all sockets which have to be closed when stopping, in the order of closing
+_SOCKET_NAMES = (
+    "signal_socket",
+    "data_socket",
+    "request_socket",
+    "status_check_socket",
+    "confirmation_socket",
+    "control_socket",
+)
+
+# signals to send in force_stop, by connection type
+_FORCE_STOP_SIGNALS = {
+    "STREAM": b"FORCE_STOP_STREAM",
+    "STREAM_METADATA": b"FORCE_STOP_STREAM_METADATA",
+    "QUERY_NEXT": b"FORCE_STOP_QUERY_NEXT",
+    "QUERY_NEXT_METADATA": b"FORCE_STOP_QUERY_NEXT_METADATA",
+}
+
+# imported on first use, see _import_thread_authenticator
+ThreadAuthenticator = None
+
+# error responses to a signal and the exceptions they are mapped to
+_SIGNAL_ERRORS = {
+    b"NO_VALID_HOST": (AuthenticationFailed,
+                       "Host is not allowed to connect."),
+    b"CONNECTION_ALREADY_OPEN": (CommunicationFailed,
+                                 "Connection is already open."),
+    b"STORING_DISABLED": (CommunicationFailed,
+                          "Data storing is disabled on sender side"),
+    b"NO_VALID_SIGNAL": (CommunicationFailed,
+                         "Either the connection type is not supported for "
+                         "this kind of sender or the targets are of wrong "
+                         "format."),
+}
+# all error responses, used to leave the success path with a single check
+_SIGNAL_ERROR_CODES = frozenset(list(_SIGNAL_ERRORS) + [b"VERSION_CONFLICT"])
+
+
+def _import_thread_authenticator():
+    """Imports the zmq ThreadAuthenticator.
+
+    zmq.auth.thread pulls in asyncio which noticeably increases the import
+    time of the API, but it is only needed if a whitelist is used.
+    """
+    # pylint: disable=global-statement
+    # pylint: disable=invalid-name
+    # pylint: disable=redefined-outer-name
+    global ThreadAuthenticator
+
+    if ThreadAuthenticator is None:
+        from zmq.auth.thread import ThreadAuthenticator
+
+
+def _json_dumps(obj):
+    """Serializes an object to utf-8 encoded json.
+
+    Uses orjson if available, which directly encodes into bytes.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        The json representation of obj as bytes.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data):
+    """Deserializes utf-8 encoded json.
+
+    Uses orjson if available, which parses the bytes without decoding them
+    first.
+
+    Args:
+        data: The json representation as bytes.
+
+    Returns:
+        The deserialized object.
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _resolve_host(host):
+    """Resolves a host of the whitelist to its IPs.
+
+    Args:
+        host: The DNS name or IP of the host.
+
+    Returns:
+        A tuple (ips, exception) where exception is set if the host could not
+        be resolved.
+    """
+
+    try:
+        if host == "localhost":
+            return [socket_m.gethostbyname(host)], None
+
+        # returns (hostname, aliaslist, ipaddrlist)
+        return socket_m.gethostbyaddr(host)[2], None
+    except Exception as excp:  # pylint: disable=broad-except
+        return None, excp
+
+
+def _get_frame_view(frame):
+    """Get a memoryview on a received frame without copying it.
+
+    Args:
+        frame: A zmq.Frame or a bytes-like object.
+
+    Returns:
+        A memoryview on the frame data.
+    """
+
+    if isinstance(frame, zmq.Frame):
+        return frame.buffer
+    return memoryview(frame)
+
+
+def _join_frames(frames):
+    """Concatenate frames into one contiguous buffer.
+
+    The buffer is allocated once and filled via memoryview assignment, thus
+    the data is copied exactly once.
+
+    Args:
+        frames: A list of zmq.Frames or bytes-like objects.
+
+    Returns:
+        A memoryview on a bytearray containing the data of all frames.
+    """
+
+    views = [_get_frame_view(frame) for frame in frames]
+
+    buf = bytearray(sum(len(view) for view in views))
+    buf_view = memoryview(buf)
+
+    offset = 0
+    for view in views:
+        buf_view[offset:offset + len(view)] = view
+        offset += len(view)
+
+    return buf_view
+
 
 def generate_filepath(base_path, config_dict, add_filename=True):
     """
@@ -78,27 +250,24 @@ def generate_filepath(base_path, config_dict, add_filename=True):
     if not config_dict or base_path is None:
         return None
 
-    if (config_dict["relative_path"] == ""
-            or config_dict["relative_path"] is None):
-        target_path = base_path
+    path_parts = [base_path]
 
-    else:
+    rel_path = config_dict["relative_path"]
+    if rel_path:
         # if the relative path starts with a slash path.join will consider it
         # as absolute path
-        if config_dict["relative_path"].startswith("/"):
-            rel_path = config_dict["relative_path"][1:]
-        else:
-            rel_path = config_dict["relative_path"]
-
-        target_path = Path(os.path.join(base_path, rel_path)).as_posix()
+        if rel_path.startswith("/"):
+            rel_path = rel_path[1:]
+        path_parts.append(rel_path)
 
     if add_filename:
-        filepath = Path(os.path.join(target_path,
-                                     config_dict["filename"])).as_posix()
+        path_parts.append(config_dict["filename"])
 
-        return filepath
-    else:
-        return target_path
+    if len(path_parts) == 1:
+        return base_path
+
+    # join and normalize everything at once
+    return Path(os.path.join(*path_parts)).as_posix()
 
 
 def generate_filepath_synced(config_dict):
@@ -173,15 +342,8 @@ def convert_suffix_list_to_regex(pattern,
         else:
             regex = ""
 
-        file_suffix = ""
-        for i in pattern:
-            if i:
-                # not an empty string
-                file_suffix += i
-            file_suffix += "|"
-
-        # remove the last "|"
-        file_suffix = file_suffix[:-1]
+        # empty entries (or None) stay empty alternatives
+        file_suffix = "|".join(i or "" for i in pattern)
 
         if file_suffix:
             regex += "({})$".format(file_suffix)
@@ -194,6 +356,8 @@ def convert_suffix_list_to_regex(pattern,
         log.debug("converted regex=%s", regex)
 
     if compile_regex:
+        # re keeps a bounded cache of compiled patterns, thus repeated
+        # initiates with the same targets do not compile the regex again
         try:
             return re.compile(regex)
         except Exception:
@@ -233,6 +397,7 @@ class Transfer(Base):
         self.signal_host = None
         self.socket_conf = {}
         self.data_socket_endpoint = None
+        self.data_socket_options = None
 
         self.context = None
         self.ext_context = None
@@ -260,9 +425,14 @@ class Transfer(Base):
         self.status = None
 
         self.socket_response_timeout = None
+        self.read_batch_size = None
 
         self.number_of_streams = None
-        self.recvd_close_from = []
+        # bit i is set if the close signal of stream i was received
+        self.recvd_close_mask = 0
+        self.all_close_mask = None
+        # maps the close signal ids to their bit in the mask
+        self.close_bits = {}
         self.reply_to_signal = False
         self.all_close_recvd = False
 
@@ -277,6 +447,8 @@ class Transfer(Base):
         self.stopped_everything = False
         self.generate_target_filepath = None
         self._remote_version = None
+        self._data_pending = False
+        self._pending_recvs = 0
 
         self.init_args = {
             "signal_host": signal_host,
@@ -326,8 +498,10 @@ class Transfer(Base):
         }
 
         # TCP socket configurations
+        # (the configuration only contains immutable values, thus a shallow
+        # copy is sufficient)
         for sckt_type, port in ports.items():
-            self.socket_conf[sckt_type] = copy.deepcopy(default_conf)
+            self.socket_conf[sckt_type] = dict(default_conf)
             self.socket_conf[sckt_type]["port"] = port
 
         self.socket_conf["signal"]["ip"] = self.signal_host
@@ -337,12 +511,31 @@ class Transfer(Base):
         default_conf["protocol"] = "ipc"
         default_conf["ip"] = None
 
-        self.socket_conf["control"] = copy.deepcopy(default_conf)
+        self.socket_conf["control"] = dict(default_conf)
         self.socket_conf["control"]["ipc_file"] = "control_API"
 
         self.is_ipv6 = False
         self.data_con_style = "bind"
 
+        # additional options for the data socket as [option, value] pairs,
+        # can be changed before start is called
+        if self.connection_type == "NEXUS":
+            # NEXUS payloads are large, thus keep less messages queued but
+            # increase the kernel receive buffer
+            self.data_socket_options = [
+                [zmq.RCVHWM, 10],
+                [zmq.RCVBUF, 16 * 1024 * 1024],
+            ]
+        elif self.connection_type in ["STREAM_METADATA",
+                                      "QUERY_NEXT_METADATA"]:
+            # metadata messages are small, thus bursts can be buffered
+            # instead of blocking the sender
+            self.data_socket_options = [
+                [zmq.RCVHWM, 10000],
+            ]
+        else:
+            self.data_socket_options = []
+
         self.poller = zmq.Poller()
 
         self.supported_connections = [
@@ -362,6 +555,8 @@ class Transfer(Base):
 
         self.status = [b"OK"]
         self.socket_response_timeout = 1000
+        # maximum number of messages handled per poll in read and get_chunk
+        self.read_batch_size = 256
 
         # In older api versions this was a class method
         # (further support for users)
@@ -580,11 +775,18 @@ class Transfer(Base):
         # time to wait for the sender to give a confirmation of the signal
         # self.signal_socket.RCVTIMEO = self.socket_response_timeout
 
+        # the signal reply is waited for with a timeout only, thus allow
+        # sending a new request if the last reply did not arrive (relaxed)
+        # and drop late replies to an earlier request (correlate)
         self.signal_socket = self._start_socket(
             name="signal_socket",
             sock_type=zmq.REQ,
             sock_con="connect",
-            endpoint=self._get_endpoint(**self.socket_conf["signal"])
+            endpoint=self._get_endpoint(**self.socket_conf["signal"]),
+            socket_options=[
+                [zmq.REQ_RELAXED, 1],
+                [zmq.REQ_CORRELATE, 1],
+            ]
         )
 
         # using a Poller to implement the signal_socket timeout
@@ -599,54 +801,53 @@ class Transfer(Base):
             raise FormatError("Argument 'targets' is of wrong format. "
                               "Has to be a list.")
 
-        # [host, port, prio]
-        if (len(targets) == 3
-                and not isinstance(targets[0], list)
-                and not isinstance(targets[1], list)
-                and not isinstance(targets[2], list)):
-            host, port, prio = targets
-            addr = "{}:{}".format(socket_m.getfqdn(host), port)
-            self.targets = [[addr, prio, ".*"]]
-
-        # [host, port, prio, suffixes]
-        elif (len(targets) == 4
-              and not isinstance(targets[0], list)
-              and not isinstance(targets[1], list)
-              and not isinstance(targets[2], list)
-              and isinstance(targets[3], list)):
-            host, port, prio, suffixes = targets
-
-            regex = convert_suffix_list_to_regex(suffixes,
-                                                 log=self.log)
-
-            addr = "{}:{}".format(socket_m.getfqdn(host), port)
-            self.targets = [[addr, prio, regex]]
+        # [host, port, prio] or [host, port, prio, suffixes]
+        if not isinstance(targets[0], list):
+            # for a single target the suffixes have to be a list (only
+            # multiple targets can define a regex instead)
+            if len(targets) == 4 and not isinstance(targets[3], list):
+                self.stop()
+                self.log.debug("targets=%s", targets)
+                raise FormatError("Argument 'targets' is of wrong format.")
+            targets = [targets]
 
         # [[host, port, prio], ...] or [[host, port, prio, suffixes], ...]
-        else:
-            for t in targets:  # pylint: disable=invalid-name
-                len_t = len(t)
-                if (isinstance(t, list)
-                        and (len_t == 3 or len_t == 4)
-                        and not isinstance(t[0], list)
-                        and not isinstance(t[1], list)
-                        and not isinstance(t[2], list)):
-
-                    if len_t == 3:
-                        host, port, prio = t
-                        suffixes = [""]
-                    else:
-                        host, port, prio, suffixes = t
+        for target in targets:
+            try:
+                self.targets.append(self._convert_target(target))
+            except FormatError:
+                self.stop()
+                self.log.debug("targets=%s", targets)
+                raise
 
-                    regex = convert_suffix_list_to_regex(suffixes,
-                                                         log=self.log)
+    def _convert_target(self, target):
+        """Converts a target into the format used for the signal.
 
-                    addr = "{}:{}".format(socket_m.getfqdn(host), port)
-                    self.targets.append([addr, prio, regex])
-                else:
-                    self.stop()
-                    self.log.debug("targets=%s", targets)
-                    raise FormatError("Argument 'targets' is of wrong format.")
+        Args:
+            target: The target as [host, port, prio] or
+                [host, port, prio, suffixes].
+
+        Returns:
+            A list of the form [<fqdn>:<port>, prio, regex].
+
+        Raises:
+            FormatError: The target is not of the expected format.
+        """
+
+        if (not isinstance(target, list)
+                or len(target) not in (3, 4)
+                or any(isinstance(i, list) for i in target[:3])):
+            raise FormatError("Argument 'targets' is of wrong format.")
+
+        if len(target) == 3:
+            host, port, prio = target
+            regex = ".*"
+        else:
+            host, port, prio, suffixes = target
+            regex = convert_suffix_list_to_regex(suffixes, log=self.log)
+
+        addr = "{}:{}".format(get_fqdn(host, self.log), port)
+        return [addr, prio, regex]
 
     def _send_signal(self, signal):
 
@@ -661,8 +862,7 @@ class Transfer(Base):
                         self.appid.encode('utf-8'),
                         signal]
 
-        trg = json.dumps(self.targets).encode('utf-8')
-        send_message.append(trg)
+        send_message.append(_json_dumps(self.targets))
 
         self.log.debug("Signal: %s", send_message)
         try:
@@ -693,33 +893,19 @@ class Transfer(Base):
             self.log.error("Timeout for signal response")
 
         # check correctness of message
-        if message and message[0] == b"VERSION_CONFLICT":
-            self.stop()
+        if not message or message[0] not in _SIGNAL_ERROR_CODES:
+            return message
+
+        self.stop()
+
+        if message[0] == b"VERSION_CONFLICT":
             raise VersionError(
                 "Versions are conflicting. Sender version: {}, API version: {}"
                 .format(message[1], __version__)
             )
 
-        elif message and message[0] == b"NO_VALID_HOST":
-            self.stop()
-            raise AuthenticationFailed("Host is not allowed to connect.")
-
-        elif message and message[0] == b"CONNECTION_ALREADY_OPEN":
-            self.stop()
-            raise CommunicationFailed("Connection is already open.")
-
-        elif message and message[0] == b"STORING_DISABLED":
-            self.stop()
-            raise CommunicationFailed("Data storing is disabled on sender "
-                                      "side")
-
-        elif message and message[0] == b"NO_VALID_SIGNAL":
-            self.stop()
-            raise CommunicationFailed("Either the connection type is not "
-                                      "supported for this kind of sender or "
-                                      "the targets are of wrong format.")
-
-        return message
+        exception, error_msg = _SIGNAL_ERRORS[message[0]]
+        raise exception(error_msg)
 
     def _check_control_server_exists(self):
         try:
@@ -798,14 +984,13 @@ class Transfer(Base):
         socket_id = "{}:{}".format(host, port).encode("utf-8")
 
         # Distinguish between IPv4 and IPv6 addresses
-        try:
-            socket_m.inet_aton(self.ip)
+        # (self.ip is always an address returned by gethostbyaddr and only
+        # IPv6 addresses contain colons)
+        self.is_ipv6 = ":" in self.ip
+        if self.is_ipv6:
+            self.log.info("IPv6 address detected: %s.", self.ip)
+        else:
             self.log.info("IPv4 address detected: %s.", self.ip)
-            self.is_ipv6 = False
-        except socket_m.error:
-            self.log.info("Address '%s' is not an IPv4 address, "
-                          "assume it is an IPv6 address.", self.ip)
-            self.is_ipv6 = True
 
         # determine socket endpoint to bind to (uses IP)
         endpoint = self._get_endpoint(
@@ -1138,6 +1323,22 @@ class Transfer(Base):
                     "Whitelist has to be a list of IPs/DNS names"
                 )
 
+            # resolve all hosts before the auth thread is stopped. The DNS
+            # lookups can be slow, thus they are done in parallel
+            if len(whitelist) > 1:
+                # the thread pool is only needed here, thus it is not
+                # imported on module level to keep the import time low
+                from multiprocessing.pool import ThreadPool
+
+                pool = ThreadPool(min(len(whitelist), 16))
+                try:
+                    resolved = pool.map(_resolve_host, whitelist)
+                finally:
+                    pool.close()
+                    pool.join()
+            else:
+                resolved = [_resolve_host(host) for host in whitelist]
+
             if self.auth is not None:
                 # to add hosts to the whitelist the authentication thread has
                 # to be stopped and the socket closed
@@ -1147,6 +1348,7 @@ class Transfer(Base):
                 self.data_socket.close()
 
             self.log.debug("Starting auth thread")
+            _import_thread_authenticator()
             self.auth = ThreadAuthenticator(self.context)
             self.auth.start()
 
@@ -1160,27 +1362,32 @@ class Transfer(Base):
                 self.auth.allow(ip[0])
 
             # receive data only from whitelisted nodes
-            for host in whitelist:
-                try:
-                    # convert DNS names to IPs
-                    if host == "localhost":
-                        ip = [socket_m.gethostbyname(host)]
-                    else:
-                        # returns (hostname, aliaslist, ipaddrlist)
-                        ip = socket_m.gethostbyaddr(host)[2]
-
-                    self.log.debug("Allowing host %s (%s)", host, ip[0])
-                    self.auth.allow(ip[0])
+            for host, (ip, excp) in zip(whitelist, resolved):
                 # getaddrinfo error
-                except socket_m.gaierror:
+                if isinstance(excp, socket_m.gaierror):
                     self.log.error("Could not get IP of host %s. Proceed.",
                                    host)
-                except Exception:
-                    self.log.error("Error was: ", exc_info=True)
+                    continue
+
+                # the exception was raised in a pool thread, its traceback
+                # is not available anymore
+                if excp is not None:
+                    self.log.error("Could not get IP of host %s: %r",
+                                   host, excp)
                     raise AuthenticationFailed(
                         "Could not get IP of host {}".format(host)
                     )
 
+                self.log.debug("Allowing host %s (%s)", host, ip[0])
+                try:
+                    self.auth.allow(ip[0])
+                except Exception:
+                    self.log.error("Could not allow host %s (%s)", host, ip[0],
+                                   exc_info=True)
+                    raise AuthenticationFailed(
+                        "Could not allow host {}".format(host)
+                    )
+
         # Recreate the socket (now with the new whitelist enabled)
         self.data_socket = self._start_socket(
             name="data socket of type {}".format(self.connection_type),
@@ -1189,6 +1396,7 @@ class Transfer(Base):
             endpoint=self.data_socket_endpoint,
             zap_domain=b"global",
             is_ipv6=self.is_ipv6,
+            socket_options=self.data_socket_options,
         )
 
         self.poller.register(self.data_socket, zmq.POLLIN)
@@ -1197,14 +1405,32 @@ class Transfer(Base):
              callback_params,
              open_callback,
              read_callback,
-             close_callback):
+             close_callback,
+             buffer=None):
         """This is experimental
 
         Args:
             callback_params:
             open_callback:
-            read_callback:
+            read_callback: Called with [metadata, payload] for every data
+                message. The payload is a memoryview on the received zmq
+                frame (no copy is made). If the metadata contains
+                "compression": "blosc", the payload is decompressed first
+                (requires the blosc module).
             close_callback:
+            buffer (optional): A writable buffer (e.g. a bytearray) the
+                payload is received into instead of allocating a new zmq
+                frame per message. The buffer is reused for every message,
+                thus the payload is only valid during the read_callback call.
+                Requires pyzmq >= 26.4.
+
+        Raises:
+            UsageError: The connection type is not NEXUS or the session was
+                not started.
+            NotSupported: A buffer was given but the installed pyzmq version
+                does not support receiving into it.
+            DataError: A payload did not fit into the given buffer.
+            NotSupported: A payload is compressed but blosc is not installed.
         """
 
         if (not self.connection_type == "NEXUS"
@@ -1214,132 +1440,275 @@ class Transfer(Base):
                 .format(self.connection_type)
             )
 
+        if buffer is not None and not hasattr(self.data_socket, "recv_into"):
+            raise NotSupported("Receiving into a buffer is not supported by "
+                               "the installed pyzmq version.")
+
         self.callback_params = callback_params
         self.open_callback = open_callback
         self.read_callback = read_callback
         self.close_callback = close_callback
 
         run_loop = True
+        self._data_pending = False
 
         while run_loop:
+            if self._data_pending:
+                # the last batch was full, thus there are most likely further
+                # messages queued which can be taken without polling first.
+                # Afterwards the poller is used again so that the signal
+                # sockets are not starved.
+                run_loop = self._read_data(buffer, flags=zmq.NOBLOCK)
+                if not run_loop:
+                    break
+
             self.log.debug("polling")
             try:
-                socks = dict(self.poller.poll())
+                events = self.poller.poll()
             except Exception:
                 self.log.error("Could not poll for new message")
                 raise
 
-            # received signal from status check socket
-            # (socket is also used for nexus signals)
-            if (self.status_check_socket in socks
-                    and socks[self.status_check_socket] == zmq.POLLIN):
-                self.log.debug("status_check_socket is polling")
-
-                message = self.status_check_socket.recv_multipart()
-                self.log.debug("status_check_socket recv: %s", message)
+            # iterate over the returned (socket, event) tuples directly instead
+            # of building a dict on every wakeup
+            for sock, event in events:
+                if not event & zmq.POLLIN:
+                    continue
 
-                # request to close the open file
-                if message[0] == b"CLOSE_FILE":
-                    if self.all_close_recvd:
+                # received signal from status check socket
+                # (socket is also used for nexus signals)
+                if sock is self.status_check_socket:
+                    self.log.debug("status_check_socket is polling")
+
+                    message = self.status_check_socket.recv_multipart()
+                    self.log.debug("status_check_socket recv: %s", message)
+
+                    # request to close the open file
+                    if message[0] == b"CLOSE_FILE":
+                        if self.all_close_recvd:
+                            self.status_check_socket.send_multipart(message)
+                            self.log.debug("status_check_socket (file "
+                                           "operation) send: %s", message)
+                            self.all_close_recvd = False
+                            self.recvd_close_mask = 0
+
+                            self.close_callback(self.callback_params,
+                                                message)
+                            run_loop = False
+                            break
+                        else:
+                            self.reply_to_signal = message
+
+                    # request to open a new file
+                    elif message[0] == b"OPEN_FILE":
                         self.status_check_socket.send_multipart(message)
                         self.log.debug("status_check_socket (file operation) "
                                        "send: %s", message)
-                        self.all_close_recvd = False
 
-                        self.close_callback(self.callback_params,
-                                            message)
-                        break
-                    else:
-                        self.reply_to_signal = message
+                        try:
+                            self.open_callback(self.callback_params,
+                                               message[1])
+                            self.file_opened = True
+                        except Exception:
+                            self.status_check_socket.send_multipart([b"ERROR"])
+                            self.log.error("Not supported message received")
 
-                # request to open a new file
-                elif message[0] == b"OPEN_FILE":
-                    self.status_check_socket.send_multipart(message)
-                    self.log.debug("status_check_socket (file operation) "
-                                   "send: %s", message)
-
-                    try:
-                        self.open_callback(self.callback_params, message[1])
-                        self.file_opened = True
-                    except Exception:
+                    # received not supported signal
+                    else:
                         self.status_check_socket.send_multipart([b"ERROR"])
                         self.log.error("Not supported message received")
 
-                # received not supported signal
-                else:
-                    self.status_check_socket.send_multipart([b"ERROR"])
-                    self.log.error("Not supported message received")
+                # received data
+                elif sock is self.data_socket:
+                    self.log.debug("data_socket is polling")
 
-            # received data
-            if (self.data_socket in socks
-                    and socks[self.data_socket] == zmq.POLLIN):
-                self.log.debug("data_socket is polling")
+                    run_loop = self._read_data(buffer)
 
-                try:
-                    multipart_message = self.data_socket.recv_multipart()
-#                    self.log.debug("multipart_message=%s",
-#                                   multipart_message[:100])
-                except Exception:
-                    self.log.error("Could not receive data due to unknown "
-                                   "error.", exc_info=True)
-                    continue
+                # received control signal
+                elif sock is self.control_socket:
+                    self.log.debug("control_socket is polling")
+                    self.control_socket.recv()
+#                    self.log.debug("Control signal received. Stopping.")
+                    raise Exception("Control signal received. Stopping.")
 
-                if multipart_message[0] == b"ALIVE_TEST":
-                    continue
+    def _read_data(self, buffer=None, flags=0):
+        """Handles the messages queued on the data socket (NEXUS).
 
-                if len(multipart_message) < 2:
-                    self.log.error("Received mutipart-message is too short. "
-                                   "Either config or file content is missing.")
-#                    self.log.debug("multipart_message=%s",
-#                                   multipart_message[:100])
-                    # TODO return errorcode
+        Instead of returning to the poller after every message, all messages
+        already queued are handled (up to read_batch_size). If the batch size
+        was reached, _data_pending is set.
 
-                try:
-                    run_loop = self._react_on_message(multipart_message)
-                except KeyboardInterrupt:
-                    self.log.debug("Keyboard interrupt detected. "
-                                   "Stopping to receive.")
-                    raise
-                except Exception:
-                    self.log.error("Unknown error while receiving files. "
-                                   "Need to abort.", exc_info=True)
-#                    raise Exception("Unknown error while receiving files. "
-#                                   "Need to abort.")
-
-            # received control signal
-            if (self.control_socket in socks
-                    and socks[self.control_socket] == zmq.POLLIN):
-                self.log.debug("control_socket is polling")
-                self.control_socket.recv()
-#                self.log.debug("Control signal received. Stopping.")
-                raise Exception("Control signal received. Stopping.")
+        Args:
+            buffer (optional): A writable buffer to receive the payload into.
+            flags (optional): The zmq flags for receiving the first message,
+                zmq.NOBLOCK if the socket was not polled before.
 
-    def _react_on_message(self, multipart_message):
+        Returns:
+            False if the file was closed and reading should stop,
+            True otherwise.
 
-        if multipart_message[0] == b"CLOSE_FILE":
+        Raises:
+            DataError: A payload did not fit into the buffer.
+            NotSupported: A payload is compressed but blosc is not
+                installed.
+        """
+
+        self._data_pending = False
+        for _ in range(self.read_batch_size):
             try:
-                # filename = multipart_message[1]
-                file_id = multipart_message[2]
+                # do not copy the frames out of the zmq buffers, the
+                # payload is handed over as memoryview
+                multipart_message = self._recv_data_message(buffer, flags)
+#                self.log.debug("multipart_message=%s",
+#                               multipart_message[:100])
+            except zmq.Again:
+                # no further message queued
+                break
+            except DataError:
+                # the buffer given by the user is too small, continuing would
+                # hand over truncated data
+                self.log.error("Could not receive data into the buffer.",
+                               exc_info=True)
+                raise
             except Exception:
-                self.log.error("Could not extract id from the "
-                               "multipart-message", exc_info=True)
-                self.log.debug("multipart-message: %s", multipart_message,
+                self.log.error("Could not receive data due to unknown "
+                               "error.", exc_info=True)
+                break
+
+            # the first message is announced by the poller, further ones are
+            # only taken if they are already available
+            flags = zmq.NOBLOCK
+
+            if multipart_message[0].bytes == _ALIVE_TEST:
+                continue
+
+            if len(multipart_message) < 2:
+                self.log.error("Received mutipart-message is too short. "
+                               "Either config or file content is missing.")
+#                self.log.debug("multipart_message=%s",
+#                               multipart_message[:100])
+                # TODO return errorcode
+
+            try:
+                if not self._react_on_message(multipart_message):
+                    return False
+            except KeyboardInterrupt:
+                self.log.debug("Keyboard interrupt detected. "
+                               "Stopping to receive.")
+                raise
+            except NotSupported:
+                # e.g. compressed data without blosc installed, all further
+                # messages would be dropped as well
+                self.log.error("Could not handle received data.",
                                exc_info=True)
                 raise
+            except Exception:
+                self.log.error("Unknown error while receiving files. "
+                               "Need to abort.", exc_info=True)
+#                raise Exception("Unknown error while receiving files. "
+#                                "Need to abort.")
+        else:
+            # batch size reached
+            self._data_pending = True
+
+        return True
+
+    def _recv_data_message(self, buffer=None, flags=0):
+        """Receives a multipart message from the data socket.
+
+        Args:
+            buffer (optional): A writable buffer to receive the payload frame
+                into.
+            flags (optional): The zmq flags to use for receiving the first
+                frame (e.g. zmq.NOBLOCK).
+
+        Returns:
+            A list of zmq frames. If a buffer was given, the payload frame is
+            a memoryview on this buffer instead.
+
+        Raises:
+            DataError: If the payload does not fit into the buffer.
+        """
+
+        if buffer is None:
+            return self.data_socket.recv_multipart(flags=flags, copy=False)
+
+        # the remaining frames of a multipart message arrive together with
+        # the first one, thus flags are only needed here
+        header = self.data_socket.recv(flags=flags, copy=False)
+        if not self.data_socket.getsockopt(zmq.RCVMORE):
+            return [header]
+
+        # only data messages are received into the buffer
+        if header.bytes in _SIGNAL_HEADERS:
+            return [header] + self.data_socket.recv_multipart(copy=False)
+
+        nbytes = self.data_socket.recv_into(buffer)
+
+        message = [header, memoryview(buffer)[:nbytes]]
+        if self.data_socket.getsockopt(zmq.RCVMORE):
+            message += self.data_socket.recv_multipart(copy=False)
+
+        if nbytes > len(buffer):
+            raise DataError(
+                "Payload of size {} does not fit into the buffer (size {}). "
+                "Payload was truncated.".format(nbytes, len(buffer))
+            )
+
+        return message
+
+    def _react_on_message(self, multipart_message):
+        """Handles a message received on the data socket (NEXUS).
+
+        Args:
+            multipart_message: The received message as list of zmq frames.
+
+        Returns:
+            False if the file was closed and the reading should stop,
+            True otherwise.
+        """
+
+        header = multipart_message[0].bytes
+
+        if header == _CLOSE_FILE:
+            # signal messages are small, thus they are converted as a whole
+            multipart_message = [frame.bytes for frame in multipart_message]
+
+            # the message has the form [CLOSE_FILE, <filename>, <id>]
+            if len(multipart_message) < 3:
+                self.log.error("Could not extract id from the "
+                               "multipart-message")
+                self.log.debug("multipart-message len=%d",
+                               len(multipart_message))
+                raise DataError("Close-file signal is missing the id")
+
+            file_id = multipart_message[2]
 
-            self.recvd_close_from.append(file_id)
             self.log.debug("Received close-file signal from "
                            "DataDispatcher-%s", file_id)
 
-            # get number of signals to wait for
-            if not self.number_of_streams:
-                self.number_of_streams = int(file_id.split("/")[1])
+            # the id has the form <stream index>/<number of streams> and
+            # does not change between files, thus it is only parsed once
+            try:
+                close_bit = self.close_bits[file_id]
+            except KeyError:
+                stream_idx, number_of_streams = file_id.split(b"/")
+
+                # get number of signals to wait for
+                if not self.number_of_streams:
+                    self.number_of_streams = int(number_of_streams)
+                    self.all_close_mask = (1 << self.number_of_streams) - 1
+
+                close_bit = 1 << int(stream_idx)
+                self.close_bits[file_id] = close_bit
+
+            self.recvd_close_mask |= close_bit
 
             # have all signals arrived?
-            self.log.debug("self.recvd_close_from=%s, "
+            self.log.debug("self.recvd_close_mask=%s, "
                            "self.number_of_streams=%s",
-                           self.recvd_close_from, self.number_of_streams)
-            if len(self.recvd_close_from) == self.number_of_streams:
+                           self.recvd_close_mask, self.number_of_streams)
+            if self.recvd_close_mask == self.all_close_mask:
                 self.log.info("All close-file-signals arrived")
                 if self.reply_to_signal:
                     self.status_check_socket.send_multipart(
@@ -1348,7 +1717,7 @@ class Transfer(Base):
                                    "send: %s", self.reply_to_signal)
 
                     self.reply_to_signal = False
-                    self.recvd_close_from = []
+                    self.recvd_close_mask = 0
 
                     self.close_callback(self.callback_params,
                                         multipart_message)
@@ -1357,38 +1726,72 @@ class Transfer(Base):
                     self.all_close_recvd = True
 
             else:
-                self.log.info("self.recvd_close_from=%s, "
+                self.log.info("self.recvd_close_mask=%s, "
                               "self.number_of_streams=%s",
-                              self.recvd_close_from, self.number_of_streams)
+                              self.recvd_close_mask, self.number_of_streams)
 
         else:
             # extract multipart message
-            try:
-                metadata = json.loads(multipart_message[0].decode("utf-8"))
-            except Exception:
-                # json.dumps of None results in 'null'
-                if multipart_message[0] != 'null':
+            # json.dumps of None results in 'null' (sent by the sender if no
+            # metadata is available), no need to run the parser on it
+            if header == b"null":
+                metadata = None
+            else:
+                try:
+                    metadata = _json_loads(header)
+                except Exception:
                     self.log.error("Could not extract metadata from the "
                                    "multipart-message.", exc_info=True)
-                    self.log.debug("multipartmessage[0] = %s",
-                                   multipart_message[0], exc_info=True)
-                metadata = None
+                    self.log.debug("multipartmessage[0] = %s", header,
+                                   exc_info=True)
+                    metadata = None
 
             # TODO validate multipart_message
             # (like correct dict-values for metadata)
 
-            try:
-                payload = multipart_message[1]
-            except Exception:
+            payload_frames = multipart_message[1:]
+            if not payload_frames:
                 self.log.warning("An empty file was received within the "
-                                 "multipart-message", exc_info=True)
+                                 "multipart-message")
                 payload = None
+            elif len(payload_frames) == 1:
+                # zero-copy view on the zmq frame
+                payload = _get_frame_view(payload_frames[0])
+            else:
+                # a payload split over multiple frames is merged once here
+                # instead of handing over a list which has to be concatenated
+                # again by the consumer
+                payload = _join_frames(payload_frames)
+
+            if (payload is not None
+                    and metadata is not None
+                    and metadata.get("compression") == "blosc"):
+                payload = self._decompress_payload(payload)
 
             self.read_callback(self.callback_params, [metadata, payload])
 
         return True
 
-    def get_chunk(self, timeout=None):
+    def _decompress_payload(self, payload):
+        """Decompresses a payload which was compressed with blosc.
+
+        Args:
+            payload: The compressed payload (bytes-like object).
+
+        Returns:
+            A memoryview on the decompressed payload.
+
+        Raises:
+            NotSupported: The blosc module is not installed.
+        """
+
+        if blosc is None:
+            raise NotSupported("Received blosc compressed data but the blosc "
+                               "module is not installed.")
+
+        return memoryview(blosc.decompress(payload))
+
+    def get_chunk(self, timeout=None, copy=True):
         """
         Receives or queries for chunks of the new files depending on the
         connection initialized.
@@ -1396,6 +1799,9 @@ class Transfer(Base):
         Args:
             timeout (optional): The time (in ms) to wait for new messages to
                                come before aborting.
+            copy (optional): If False, the data chunk is not copied out of
+                             the zmq message but returned as a memoryview on
+                             it.
 
         Returns:
             Either
@@ -1425,57 +1831,95 @@ class Transfer(Base):
                                exc_info=True)
                 return None, None
 
-        timestamp = time.time()
+        if timeout:
+            # timeout is in ms, the clock in s
+            deadline = _monotonic() + timeout / 1000.0
 
         while True:
-            # receive data
-            try:
-                socks = dict(self.poller.poll(timeout))
-            except Exception:
-                if self.stopped_everything:
-                    self.log.debug("Stopping poller")
-                    raise KeyboardInterrupt
-                else:
-                    self.log.error("Could not poll for new message")
-                    raise
+            multipart_message = None
+            if self._data_pending:
+                # the last message was received right before, thus further
+                # messages are most likely queued already and can be taken
+                # without polling first
+                multipart_message = self._recv_pending_chunk(copy)
+
+            if multipart_message is None:
+                # receive data
+                try:
+                    events = self.poller.poll(timeout)
+                except Exception:
+                    if self.stopped_everything:
+                        self.log.debug("Stopping poller")
+                        raise KeyboardInterrupt
+                    else:
+                        self.log.error("Could not poll for new message")
+                        raise
 
-            # received signal from status check socket
-            if (self.status_check_socket in socks
-                    and socks[self.status_check_socket] == zmq.POLLIN):
-
-                message = self.status_check_socket.recv_multipart()
-#                self.log.debug("status_check_socket recv: %s", message)
-
-                # request to close the open file
-                if message[0] == b"STATUS_CHECK":
-                    self.status_check_socket.send_multipart(self.status)
-#                    self.log.debug("status_check_socket send: %s",
-#                                   self.status)
-                elif message[0] == b"RESET_STATUS":
-                    self.status = [b"OK"]
-                    self.log.debug("Reset request received. Status changed "
-                                   "to: %s", self.status)
-                    self.status_check_socket.send_multipart(self.status)
-                # received not supported signal
-                else:
-                    self.status_check_socket.send_multipart([b"ERROR"])
-                    self.log.error("Not supported message received")
+                status_check_ready = False
+                data_ready = False
+                for sock, event in events:
+                    if event != zmq.POLLIN:
+                        continue
+                    if sock is self.status_check_socket:
+                        status_check_ready = True
+                    elif sock is self.data_socket:
+                        data_ready = True
+
+                # received signal from status check socket
+                if status_check_ready:
+
+                    message = self.status_check_socket.recv_multipart()
+#                    self.log.debug("status_check_socket recv: %s", message)
+
+                    # request to close the open file
+                    if message[0] == b"STATUS_CHECK":
+                        self.status_check_socket.send_multipart(self.status)
+#                        self.log.debug("status_check_socket send: %s",
+#                                       self.status)
+                    elif message[0] == b"RESET_STATUS":
+                        self.status = [b"OK"]
+                        self.log.debug("Reset request received. Status "
+                                       "changed to: %s", self.status)
+                        self.status_check_socket.send_multipart(self.status)
+                    # received not supported signal
+                    else:
+                        self.status_check_socket.send_multipart([b"ERROR"])
+                        self.log.error("Not supported message received")
+            else:
+                data_ready = True
 
             # if there was a response
-            if (self.data_socket in socks
-                    and socks[self.data_socket] == zmq.POLLIN):
+            if data_ready:
 
-                try:
-                    multipart_message = self.data_socket.recv_multipart()
-                except Exception:
-                    self.log.error("Receiving data..failed.", exc_info=True)
-                    return [None, None]
+                if multipart_message is None:
+                    try:
+                        multipart_message = self.data_socket.recv_multipart(
+                            copy=copy
+                        )
+                    except Exception:
+                        self.log.error("Receiving data..failed.",
+                                       exc_info=True)
+                        return [None, None]
+
+                    # for queries only one reply is sent per request, which
+                    # cannot be there right after the next request was sent
+                    self._data_pending = (
+                        "STREAM" in self.started_connections
+                    )
+                    self._pending_recvs = 0
+
+                if not copy:
+                    # the metadata and signals are small and needed as bytes
+                    multipart_message = (
+                        [multipart_message[0].bytes]
+                        + [_get_frame_view(frame)
+                           for frame in multipart_message[1:]]
+                    )
 
                 if multipart_message[0] == b"ALIVE_TEST":
                     if timeout:
                         # measure how much time is left from the timeout value
-                        # timeout is in ms, timestamp in s
-                        timeout -= (time.time() - timestamp) * 1000
+                        timeout = (deadline - _monotonic()) * 1000
                     if timeout is not None and timeout < 0:
                         return [None, None]
                     else:
@@ -1483,13 +1927,15 @@ class Transfer(Base):
                 elif len(multipart_message) < 2:
                     self.log.error("Received mutipart-message is too short. "
                                    "Either config or file content is missing.")
-                    self.log.debug("multipart_message=%s",
-                                   multipart_message[:100])
+                    if self.log.isEnabledFor(logging.DEBUG):
+                        self.log.debug("multipart_message len=%d first=%r",
+                                       len(multipart_message),
+                                       multipart_message[0][:64])
                     return [None, None]
 
                 # extract multipart message
                 try:
-                    metadata = json.loads(multipart_message[0].decode("utf-8"))
+                    metadata = _json_loads(multipart_message[0])
                 except Exception:
                     self.log.error("Could not extract metadata from the "
                                    "multipart-message.", exc_info=True)
@@ -1518,6 +1964,38 @@ class Transfer(Base):
 
                 return [None, None]
 
+    def _recv_pending_chunk(self, copy=True):
+        """Receives the next data message if it is already queued.
+
+        After read_batch_size messages were received this way, the poller has
+        to be used again so that the status check socket is not starved.
+
+        Args:
+            copy (optional): If False, the message is received as zmq frames.
+
+        Returns:
+            The multipart message or None if no message was queued or the
+            batch size was reached.
+        """
+
+        if self._pending_recvs >= self.read_batch_size:
+            self._data_pending = False
+            return None
+
+        try:
+            message = self.data_socket.recv_multipart(flags=zmq.NOBLOCK,
+                                                      copy=copy)
+        except zmq.Again:
+            self._data_pending = False
+            return None
+        except Exception:
+            self.log.error("Receiving data..failed.", exc_info=True)
+            self._data_pending = False
+            return None
+
+        self._pending_recvs += 1
+        return message
+
     def check_file_closed(self, metadata, payload):
         """Checks if all chunks were received.
 
@@ -1543,11 +2021,12 @@ class Transfer(Base):
         # or the size of the origin file was a multiple of the
         # chunksize and this is the last expected chunk (chunk_number
         # starts with 0)
-        return (
-            len(payload) < m["chunksize"]
-            or (m["filesize"] % m["chunksize"] == 0
-                and m["filesize"] / m["chunksize"] == m["chunk_number"] + 1)
-        )
+        chunksize = m["chunksize"]
+        if len(payload) < chunksize:
+            return True
+
+        n_chunks, remainder = divmod(m["filesize"], chunksize)
+        return remainder == 0 and n_chunks == m["chunk_number"] + 1
 
     def get(self, timeout=None):
         """
@@ -1578,7 +2057,12 @@ class Transfer(Base):
             # --------------------------------------------------------------------
             try:
                 # timeout (in ms) to be able to react on system signals
-                [metadata, payload] = self.get_chunk(timeout=timeout)
+                # the chunks are merged (thus copied) anyway, receiving them
+                # without copying avoids copying the payload twice
+                [metadata, payload] = self.get_chunk(
+                    timeout=timeout,
+                    copy="METADATA" in self.connection_type
+                )
             except KeyboardInterrupt:
                 raise
             except Exception:
@@ -1607,7 +2091,11 @@ class Transfer(Base):
                     "data": [],
                 }
 
-            all_received[file_id]["data"].append(copy.deepcopy(payload))
+            # for data connections the payload is a memoryview on the
+            # received zmq frame (not a copy). It stays valid because the view
+            # keeps the frame alive, the data is only copied when the chunks
+            # are merged once the file is complete
+            all_received[file_id]["data"].append(payload)
 
             # --------------------------------------------------------------------
             # return closed file
@@ -1817,27 +2305,36 @@ class Transfer(Base):
         # --------------------------------------------------------------------
         if ("confirmation_required" in metadata
                 and metadata["confirmation_required"]):
-            file_id = generate_file_identifier(metadata)
             # send confirmation
             try:
-                topic = metadata["confirmation_required"].encode()
-
+                # the topic, file id and message format do not change between
+                # the chunks of a file, thus they are only determined once
                 try:
-                    remote_version = LooseVersion(metadata["version"])
+                    file_id, message, add_chunk_number = desc["confirmation"]
                 except KeyError:
-                    remote_version = None
-
-                # to ensure backwards compatibility with 4.0.x versions
-                # use LooseVersion because otherwise a test like
-                # 4.0.10 <= 4.0.7 fails
-                if (remote_version is None
-                        or remote_version <= LooseVersion("4.0.7")):
-                    message = [topic,
+                    file_id = generate_file_identifier(metadata)
+                    message = [metadata["confirmation_required"].encode(),
                                file_id.encode("utf-8")]
-                else:
-                    message = [topic,
-                               file_id.encode("utf-8"),
-                               str(metadata["chunk_number"]).encode("utf-8")]
+
+                    try:
+                        remote_version = LooseVersion(metadata["version"])
+                    except KeyError:
+                        remote_version = None
+
+                    # to ensure backwards compatibility with 4.0.x versions
+                    # use LooseVersion because otherwise a test like
+                    # 4.0.10 <= 4.0.7 fails
+                    add_chunk_number = not (
+                        remote_version is None
+                        or remote_version <= LooseVersion("4.0.7")
+                    )
+                    desc["confirmation"] = file_id, message, add_chunk_number
+
+                topic = message[0]
+                if add_chunk_number:
+                    message = message + [
+                        str(metadata["chunk_number"]).encode("utf-8")
+                    ]
 
                 self.confirmation_socket.send_multipart(message)
                 self.log.debug("Sending confirmation for chunk %s of "
@@ -1897,7 +2394,8 @@ class Transfer(Base):
 
             try:
                 # timeout (in ms) to be able to react on system signals
-                [metadata, payload] = self.get_chunk(timeout)
+                # the chunks are directly written into the file
+                [metadata, payload] = self.get_chunk(timeout, copy=False)
             except KeyboardInterrupt:
                 raise
             except Exception:
@@ -1969,14 +2467,14 @@ class Transfer(Base):
         """
 
         # Close open file handler to prevent file corruption
-        for target in list(self.file_descriptors):
+        while self.file_descriptors:
+            target, desc = self.file_descriptors.popitem()
             try:
-                self.file_descriptors[target]["file"].close()
+                desc["file"].close()
                 self.log.warning("Not all chunks were received for file %s",
                                  target)
             except KeyError:
                 pass
-            del self.file_descriptors[target]
 
         # Send signal that the application is quitting
         if self.signal_socket and self.signal_exchanged:
@@ -1993,43 +2491,38 @@ class Transfer(Base):
             # TODO: need to check correctness of signal?
 #            message = self._send_signal(signal)
 
-            try:
-                del self.started_connections["STREAM"]
-            except KeyError:
-                pass
-            try:
-                del self.started_connections["QUERY_NEXT"]
-            except KeyError:
-                pass
+            self.started_connections.pop("STREAM", None)
+            self.started_connections.pop("QUERY_NEXT", None)
 
         # unregister sockets from poller
         self.poller = None
 
+        # the control socket is set to None when closed
+        remove_control_ipc = self.control_socket is not None
+
         # Close ZMQ connections
-        try:
-            self._stop_socket(name="signal_socket")
-            self._stop_socket(name="data_socket")
-            self._stop_socket(name="request_socket")
-            self._stop_socket(name="status_check_socket")
-            self._stop_socket(name="confirmation_socket")
-            self._stop_socket(name="control_socket")
-
-            # remove ipc remainings
-            if self.control_socket is not None:
-                control_addr = self._get_ipc_addr(
-                    ipc_file=self.socket_conf["control"]["ipc_file"]
-                )
-                try:
-                    os.remove(control_addr)
-                    self.log.debug("Removed ipc address: %s", control_addr)
-                except OSError:
-                    self.log.warning("Could not remove ipc address: %s",
-                                     control_addr)
-                except Exception:
-                    self.log.warning("Could not remove ipc address: %s",
-                                     control_addr, exc_info=True)
-        except Exception:
-            self.log.error("closing ZMQ Sockets...failed.", exc_info=True)
+        # each socket is closed separately, so that a failure does not leave
+        # the remaining ones open
+        for name in _SOCKET_NAMES:
+            try:
+                self._stop_socket(name=name)
+            except Exception:
+                self.log.error("Closing %s...failed.", name, exc_info=True)
+
+        # remove ipc remainings
+        if remove_control_ipc:
+            control_addr = self._get_ipc_addr(
+                ipc_file=self.socket_conf["control"]["ipc_file"]
+            )
+            try:
+                os.remove(control_addr)
+                self.log.debug("Removed ipc address: %s", control_addr)
+            except OSError:
+                self.log.warning("Could not remove ipc address: %s",
+                                 control_addr)
+            except Exception:
+                self.log.warning("Could not remove ipc address: %s",
+                                 control_addr, exc_info=True)
 
         # stopping authentication thread
         if self.auth is not None:
@@ -2074,16 +2567,8 @@ class Transfer(Base):
             self.context = zmq.Context()
             self.ext_context = False
 
-        signal = None
         # Signal exchange
-        if self.connection_type == "STREAM":
-            signal = b"FORCE_STOP_STREAM"
-        elif self.connection_type == "STREAM_METADATA":
-            signal = b"FORCE_STOP_STREAM_METADATA"
-        elif self.connection_type == "QUERY_NEXT":
-            signal = b"FORCE_STOP_QUERY_NEXT"
-        elif self.connection_type == "QUERY_NEXT_METADATA":
-            signal = b"FORCE_STOP_QUERY_NEXT_METADATA"
+        signal = _FORCE_STOP_SIGNALS.get(self.connection_type)
 
         self.log.debug("Create socket for signal exchange...")
 
@@ -100,6 +100,7 @@ from .utils_network import (
     execute_ldapsearch,
     extend_whitelist,
     convert_socket_to_fqdn,
+    get_fqdn,
     is_ipv6_address,
     get_socket_id,
     generate_sender_id,
@@ -177,6 +178,7 @@ __all__ = [
     "execute_ldapsearch",
     "extend_whitelist",
     "convert_socket_to_fqdn",
+    "get_fqdn",
     "is_ipv6_address",
     "get_socket_id",
     "generate_sender_id",
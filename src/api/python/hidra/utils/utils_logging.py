@@ -111,6 +111,16 @@ def is_windows():
     return platform.system() == "Windows"
 
 
+# maps the log level names to the logging levels
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
 def convert_str_to_log_level(level):
     """Convert log level from a string to the corresponding logging equivalent.
 
@@ -121,7 +131,10 @@ def convert_str_to_log_level(level):
     Return:
         The corresponding logging level.
     """
-    return getattr(logging, level.upper())
+    try:
+        return _LOG_LEVELS[level.lower()]
+    except KeyError:
+        return getattr(logging, level.upper())
 
 
 def convert_log_level_to_str(level):
@@ -502,52 +515,17 @@ class LoggingFunction(object):
     """
 
     def __init__(self, level="debug"):
-        if level == "debug":
-            # using output
-            self.debug = self.out
-            self.info = self.out
-            self.warning = self.out
-            self.error = self.out
-            self.critical = self.out
-        elif level == "info":
-            # using no output
-            self.debug = self.no_out
-            # using output
-            self.info = self.out
-            self.warning = self.out
-            self.error = self.out
-            self.critical = self.out
-        elif level == "warning":
-            # using no output
-            self.debug = self.no_out
-            self.info = self.no_out
-            # using output
-            self.warning = self.out
-            self.error = self.out
-            self.critical = self.out
-        elif level == "error":
-            # using no output
-            self.debug = self.no_out
-            self.info = self.no_out
-            self.warning = self.no_out
-            # using output
-            self.error = self.out
-            self.critical = self.out
-        elif level == "critical":
-            # using no output
-            self.debug = self.no_out
-            self.info = self.no_out
-            self.warning = self.no_out
-            self.error = self.no_out
-            # using output
-            self.critical = self.out
-        elif level is None:
-            # using no output
-            self.debug = self.no_out
-            self.info = self.no_out
-            self.warning = self.no_out
-            self.error = self.no_out
-            self.critical = self.no_out
+        if level is None:
+            self.level = None
+        else:
+            self.level = convert_str_to_log_level(level)
+
+        # levels below the configured one are using no output
+        for name, logging_level in _LOG_LEVELS.items():
+            if self.isEnabledFor(logging_level):
+                setattr(self, name, self.out)
+            else:
+                setattr(self, name, self.no_out)
 
     def out(self, msg, *args, **kwargs):
         """Prints to screen.
@@ -570,7 +548,25 @@ class LoggingFunction(object):
         else:
             print(msg)
 
-    def no_out(self, msg, *args, **kwargs):
+    @staticmethod
+    def no_out(msg, *args, **kwargs):
         """Print nothing.
+
+        Static so that the disabled levels are bound to a plain function and
+        calling them does not have to go through a bound method.
         """
         pass
+
+    def isEnabledFor(self, level):  # pylint: disable=invalid-name
+        """Checks if messages of this level would be printed.
+
+        Same interface as logging.Logger.isEnabledFor.
+
+        Args:
+            level: The logging level to check (e.g. logging.DEBUG).
+
+        Returns:
+            True if messages of this level are printed, False otherwise.
+        """
+
+        return self.level is not None and level >= self.level
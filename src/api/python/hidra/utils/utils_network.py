@@ -35,8 +35,6 @@ import socket as socket_m
 import threading
 # import time
 
-import ldap3
-
 from .utils_datatypes import (
     IpcAddresses,  # noqa F401
     Endpoints,
@@ -50,7 +48,18 @@ _LOCK = threading.Lock()
 _FQDN_CACHE = {}
 
 
-def _get_fqdn(host, log):
+def get_fqdn(host, log):
+    """Get the fully qualified domain name of a host.
+
+    The result is cached because the lookup can take a long time.
+
+    Args:
+        host: The host name to convert.
+        log: Logger used for log messages.
+
+    Returns:
+        The fully qualified domain name of the host.
+    """
     # pylint: disable=global-variable-not-assigned
     global _LOCK
     global _FQDN_CACHE
@@ -99,7 +108,7 @@ def check_netgroup(hostname,
     netgroup = execute_ldapsearch(log, netgroup_name, ldapuri)
 
     # convert host to fully qualified DNS name
-    hostname = _get_fqdn(hostname, log)
+    hostname = get_fqdn(hostname, log)
 
     if hostname in netgroup:
         return True
@@ -141,6 +150,10 @@ def execute_ldapsearch(log, ldap_cn, ldapuri):
 
 def _parse_ldap3(ldapuri, ldap_cn, log):
 
+    # ldap3 is only needed if netgroups are used, importing it on module level
+    # slows down the import of hidra.utils for everybody else
+    import ldap3  # pylint: disable=import-outside-toplevel
+
     if isinstance(ldapuri, str):
         # to stay backwards compatible in config (<=4.2.0)
         server = ldap3.Server(ldapuri)
@@ -210,7 +223,7 @@ def _parse_ldap3(ldapuri, ldap_cn, log):
 #
 #    if not lines and not error:
 #        log.debug("%s is not a netgroup, considering it as hostname", ldap_cn)
-#        return [_get_fqdn(ldap_cn, log)]
+#        return [get_fqdn(ldap_cn, log)]
 #
 #    netgroup = []
 #    match_host = re.compile(r'nisNetgroupTriple: [(]([\w|\S|.]+),.*,[)]',
@@ -220,7 +233,7 @@ def _parse_ldap3(ldapuri, ldap_cn, log):
 #        if match_host.match(line):
 #            if match_host.match(line).group(1) not in netgroup:
 #                netgroup.append(
-#                    _get_fqdn(match_host.match(line).group(1), log)
+#                    get_fqdn(match_host.match(line).group(1), log)
 #                )
 #
 #    if error or not netgroup:
@@ -255,7 +268,7 @@ def extend_whitelist(whitelist, ldapuri, log):
         whitelist = [whitelist]
 
     if is_windows():
-        ext_whitelist = [_get_fqdn(host, log) for host in whitelist]
+        ext_whitelist = [get_fqdn(host, log) for host in whitelist]
     else:
         ext_whitelist = []
         for i in whitelist:
@@ -296,11 +309,11 @@ def convert_socket_to_fqdn(socketids, log):
                               "is missing")
                     raise
 
-                new_target = "{}:{}".format(_get_fqdn(host, log), port)
+                new_target = "{}:{}".format(get_fqdn(host, log), port)
                 target[0] = new_target
     else:
         host, port = socketids.split(":")
-        socketids = "{}:{}".format(_get_fqdn(host, log), port)
+        socketids = "{}:{}".format(get_fqdn(host, log), port)
 
     log.debug("converted socketids=%s", socketids)
 
@@ -627,6 +640,7 @@ def start_socket(name,
     sock_type_as_str = MAPPING_ZMQ_CONSTANTS_TO_STR[sock_type]
     endpoint_to_print = endpoint
     port = None
+    socket = None
 
     try:
         # create socket
@@ -663,6 +677,9 @@ def start_socket(name,
     except Exception:
         log.error("Failed to %s %s (%s, %s): '%s'", name, message.lower(),
                   sock_con, sock_type_as_str, endpoint_to_print, exc_info=True)
+        # do not leave an unbound socket behind
+        if socket is not None:
+            socket.close(linger=0)
         raise
 
     return socket, port
@@ -127,13 +127,13 @@ class NexusReceiver:
 
         self.whitelist = params["whitelist"]
 
-        self.log.info("Configured whitelist: {0}".format(self.whitelist))
+        self.log.info("Configured whitelist: %s", self.whitelist)
 
         self.target_dir = os.path.normpath(params["target_dir"])
         self.data_ip = params["data_stream_ip"]
         self.data_port = params["data_stream_port"]
 
-        self.log.info("Writing to directory '{0}'".format(self.target_dir))
+        self.log.info("Writing to directory '%s'", self.target_dir)
 
         self.transfer = Transfer("NEXUS", use_log=True)
 
@@ -179,7 +179,8 @@ class NexusReceiver:
     def read_callback(self, params, received_data):
         metadata = received_data[0]
         data = received_data[1]
-        print(params, metadata)
+        # called for every data message, thus only formatted if needed
+        self.log.debug("%s %s", params, metadata)
 
         params["target_fp"].write(data)
 
@@ -204,7 +205,7 @@ class NexusReceiver:
                                           self.open_callback,
                                           self.read_callback,
                                           self.close_callback)
-                logging.debug("Retrieved: " + str(data)[:100])
+                self.log.debug("Retrieved: %.100s", data)
 
 #                if data == "CLOSE_FILE":
 #                    break
@@ -60,6 +60,11 @@ else:
 
 __author__ = 'Manuela Kuhn <manuela.kuhn@desy.de>'
 
+_MESSAGE_PART = "message part %s from file '%s' to '%s' with priority %s"
+_SENDING_MSG = "Sending " + _MESSAGE_PART
+_SENDING_FAILED_MSG = "Sending " + _MESSAGE_PART + " failed."
+_SENDING_METADATA_MSG = "Sending metadata of " + _MESSAGE_PART
+
 
 class DataFetcherBase(Base, ABC):
     """
@@ -250,9 +255,7 @@ class DataFetcherBase(Base, ABC):
                     endpoint="tcp://{}".format(target)
                 )
 
-            message_suffix = ("message part %s from file '%s' to '%s' with "
-                              "priority %s", chunk_number, self.source_file,
-                              target, prio)
+            message_suffix = (chunk_number, self.source_file, target, prio)
 
             # send data to the data stream to store it in the storage system
             if prio == 0:
@@ -285,7 +288,7 @@ class DataFetcherBase(Base, ABC):
                     self.log.debug("Raising DataHandling error", exc_info=True)
                     raise utils.DataError(
                         "Sending (metadata of) {} failed."
-                        .format(message_suffix[0]), message_suffix[1:]
+                        .format(_MESSAGE_PART % message_suffix)
                     )
 
             else:
@@ -301,10 +304,8 @@ class DataFetcherBase(Base, ABC):
                 except Exception:
                     # remember that there was an exception but keep sending
                     # to other targets
-                    self.log.error(
-                        "Sending {} failed.".format(message_suffix[0]),
-                        *message_suffix[1:], exc_info=True
-                    )
+                    self.log.error(_SENDING_FAILED_MSG, *message_suffix,
+                                   exc_info=True)
                     sending_failed = True
 
         if sending_failed:
@@ -337,16 +338,14 @@ class DataFetcherBase(Base, ABC):
 
         if send_type == "data":
             tracker = connection.send_multipart(payload, **zmq_options)
-            self.log.info("Sending {}".format(message_suffix[0]),
-                          *message_suffix[1:])
+            self.log.info(_SENDING_MSG, *message_suffix)
 
         elif send_type == "metadata":
             # json.dumps(None) is 'N.'
             send_msg = [json.dumps(metadata).encode("utf-8"),
                         json.dumps(None).encode("utf-8")]
             tracker = connection.send_multipart(send_msg, **zmq_options)
-            self.log.info("Sending metadata of {}".format(message_suffix[0]),
-                          *message_suffix[1:])
+            self.log.info(_SENDING_METADATA_MSG, *message_suffix)
             self.log.debug("metadata=%s", metadata)
         else:
             self.log.error("send_type %s is not supported", send_type)
@@ -47,7 +47,8 @@ def Connector(p_id, log_queue, control_queue, con_str, multiproc_queue):
 
     log = helpers.get_logger("Connector-{}".format(p_id), log_queue)
 
-    log.info("Connecter #{} connecting to Karabo bridge with: {}".format(p_id, con_str))
+    log.info("Connecter #%s connecting to Karabo bridge with: %s",
+             p_id, con_str)
 #    print("Connecter #{} connecting to Karabo bridge with: {}".format(p_id, con_str))
 
     krb_client = KaraboBridge(con_str)
@@ -172,7 +173,7 @@ class Synchronizing(threading.Thread):
 
                 if len(trainid_set) == self.n_connectors:
 
-                    self.log.debug("Full image detected: {}".format(trainid))
+                    self.log.debug("Full image detected: %s", trainid)
 
                     full_image = {x[1]["channel"]: x[1]["data"] for x in trainid_set}
 
@@ -233,8 +234,8 @@ class EventDetector(EventDetectorBase):
 
         # Only proceed if the configuration was correct
         if check_passed:
-            self.log.info("Configuration for event detector: {0}"
-                          .format(config_reduced))
+            self.log.info("Configuration for event detector: %s",
+                          config_reduced)
         else:
             raise Exception("Wrong configuration")
 
@@ -356,12 +357,12 @@ class EventDetector(EventDetectorBase):
             time.sleep(1)
 
             cq_empty = self.control_queue.empty()
-            self.log.debug("control queue empty {}".format(cq_empty))
+            self.log.debug("control queue empty %s", cq_empty)
             while not self.control_queue.empty() and check:
                 if i < n_checks:
                     time.sleep(1)
                     cq_empty = self.control_queue.empty()
-                    self.log.debug("control queue empty 2 {}".format(cq_empty))
+                    self.log.debug("control queue empty 2 %s", cq_empty)
                     i += 1
                 else:
                     check = False
@@ -78,6 +78,7 @@ except ImportError:
 
 from eventdetectorbase import EventDetectorBase
 from hidra import convert_suffix_list_to_regex
+from hidra.utils import WrongConfiguration
 from inotify_utils import get_event_message, CleanUp, common_stop
 
 __author__ = 'Manuela Kuhn <manuela.kuhn@desy.de>'
@@ -109,6 +110,8 @@ class EventDetector(EventDetectorBase):
         self.paths = None
         self.mon_subdirs = None
         self.mon_regex_per_event = None
+        self.mon_mask_per_event = None
+        self.relevant_mask = None
         self.mon_regex = None
         self.timeout = None
         self.history = None
@@ -191,6 +194,26 @@ class EventDetector(EventDetectorBase):
                                exc_info=True)
                 raise
 
+        # the event names are resolved to their inotify mask bits once so
+        # that the events can be checked without building their description
+        self.mon_mask_per_event = []
+        for key, regex in iteritems(self.mon_regex_per_event):
+            try:
+                event_mask = getattr(inotifyx, key)
+            except AttributeError:
+                raise WrongConfiguration(
+                    "Monitored event '{}' is not an inotify event".format(key)
+                )
+            self.mon_mask_per_event.append((event_mask, key, regex))
+
+        # directory creations and renames have to be tracked as well to keep
+        # the watches up to date
+        self.relevant_mask = (inotifyx.IN_CREATE
+                              | inotifyx.IN_MOVED_FROM
+                              | inotifyx.IN_MOVED_TO)
+        for event_mask, _, _ in self.mon_mask_per_event:
+            self.relevant_mask |= event_mask
+
         self.log.debug("regexes=%s", regexes)
         self.mon_regex = convert_suffix_list_to_regex(regexes,
                                                       suffix=False,
@@ -330,28 +353,29 @@ class EventDetector(EventDetectorBase):
 
         for event in events:
 
-            if not event.name:
+            mask = event.mask
+
+            # most events (e.g. IN_OPEN, IN_MODIFY) are not of interest and
+            # are skipped before doing any further work
+            if not event.name or not mask & self.relevant_mask:
                 continue
 
             try:
                 path = self.wd_to_path[event.wd]
             except Exception:
                 path = removed_wd
-            parts = event.get_mask_description()
-            parts_array = parts.split("|")
 
-            is_dir = ("IN_ISDIR" in parts_array)
-            is_created = ("IN_CREATE" in parts_array)
-            is_moved_from = ("IN_MOVED_FROM" in parts_array)
-            is_moved_to = ("IN_MOVED_TO" in parts_array)
+            is_dir = bool(mask & inotifyx.IN_ISDIR)
+            is_created = bool(mask & inotifyx.IN_CREATE)
+            is_moved_from = bool(mask & inotifyx.IN_MOVED_FROM)
+            is_moved_to = bool(mask & inotifyx.IN_MOVED_TO)
 
             current_mon_event = None
             current_mon_regex = None
-            for key, value in iteritems(self.mon_regex_per_event):
-                if key in parts_array:
+            for event_mask, key, value in self.mon_mask_per_event:
+                if mask & event_mask:
                     current_mon_event = key
                     current_mon_regex = value
-#                    current_mon_regex = self.mon_regex_per_event[key]
 
 #            if not is_dir:
 #                self.log.debug("{} {} {}".format(path, event.name, parts))
@@ -372,6 +396,7 @@ class EventDetector(EventDetectorBase):
                 # self.log.debug("{} {} {}".format(path, event.name, parts)
                 # self.log.debug(event.name)
 
+                parts = event.get_mask_description()
                 dirname = os.path.join(path, event.name)
                 self.log.info("Directory event detected: %s, %s",
                               dirname, parts)
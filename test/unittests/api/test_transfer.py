@@ -298,6 +298,24 @@ class TestTransfer(TestBase):
                 compile_regex=True
             )
 
+    def test__join_frames(self):
+
+        # --------------------------------------------------------------------
+        # zmq frames
+        # --------------------------------------------------------------------
+        ret_val = m_transfer._join_frames([zmq.Frame(b"abc"),
+                                           zmq.Frame(b"de")])
+        self.assertIsInstance(ret_val, memoryview)
+        self.assertEqual(ret_val.tobytes(), b"abcde")
+
+        # --------------------------------------------------------------------
+        # mixed frames
+        # --------------------------------------------------------------------
+        ret_val = m_transfer._join_frames([zmq.Frame(b"abc"),
+                                           b"",
+                                           memoryview(bytearray(b"de"))])
+        self.assertEqual(ret_val.tobytes(), b"abcde")
+
     def test__setup(self):
         current_func_name = inspect.currentframe().f_code.co_name
 
@@ -598,6 +616,24 @@ class TestTransfer(TestBase):
         expected = [["{}:{}".format(host, port), prio, ".*"]]
         self.assertListEqual(transfer.targets, expected)
 
+        # --------------------------------------------------------------------
+        # one target with suffixes not given as list
+        # --------------------------------------------------------------------
+        targets = [host, port, prio, ".*"]
+
+        with self.assertRaises(m_transfer.FormatError):
+            transfer._set_targets(targets)
+
+        # --------------------------------------------------------------------
+        # multiple targets with regex instead of suffixes
+        # --------------------------------------------------------------------
+        targets = [[host, port, prio, ".*.tif"]]
+
+        transfer._set_targets(targets)
+
+        expected = [["{}:{}".format(host, port), prio, ".*.tif"]]
+        self.assertListEqual(transfer.targets, expected)
+
         # --------------------------------------------------------------------
         # multiple targets without suffixes
         # --------------------------------------------------------------------
@@ -935,7 +971,8 @@ class TestTransfer(TestBase):
         self.log.info("%s: IPV4", current_func_name)
 
         data_socket_prop = [host, port]
-        with mock.patch("socket.inet_aton") as mock_inet_aton:
+        with mock.patch("socket.gethostbyaddr") as mock_gethostbyaddr:
+            mock_gethostbyaddr.return_value = ("", [""], ["127.0.0.1"])
             ret_val = transfer._get_data_endpoint(data_socket_prop)
 
         self.assertFalse(transfer.is_ipv6)
@@ -947,8 +984,8 @@ class TestTransfer(TestBase):
         self.log.info("%s: IPV6", current_func_name)
 
         data_socket_prop = [host, port]
-        with mock.patch("socket.inet_aton") as mock_inet_aton:
-            mock_inet_aton.side_effect = socket.error
+        with mock.patch("socket.gethostbyaddr") as mock_gethostbyaddr:
+            mock_gethostbyaddr.return_value = ("", [""], ["::1"])
             ret_val = transfer._get_data_endpoint(data_socket_prop)
 
         self.assertTrue(transfer.is_ipv6)
@@ -1464,6 +1501,28 @@ class TestTransfer(TestBase):
         # cleanup
         transfer = m_transfer.Transfer(**self.transfer_conf)
 
+        # --------------------------------------------------------------------
+        # whitelist: multiple hosts
+        # --------------------------------------------------------------------
+
+        whitelist = ["test_host1", "test_host2", "test_host3"]
+
+        with mock.patch("socket.gethostbyaddr") as mock_gethostbyaddr:
+            mock_gethostbyaddr.side_effect = (
+                lambda host: (host, [], [host + "_ip"])
+            )
+
+            transfer.register(whitelist)
+
+            self.assertEqual(mock_gethostbyaddr.call_count, 3)
+            # pylint: disable=no-member
+            transfer.auth.allow.assert_has_calls(
+                [mock.call(host + "_ip") for host in whitelist]
+            )
+
+        # cleanup
+        transfer = m_transfer.Transfer(**self.transfer_conf)
+
         # --------------------------------------------------------------------
         # whitelist: getting ip fails
         # --------------------------------------------------------------------
@@ -1495,14 +1554,435 @@ class TestTransfer(TestBase):
             with self.assertRaises(m_transfer.AuthenticationFailed):
                 transfer.register(whitelist)
 
+        self.assertTrue(transfer.log.error.called)
+        self.assertEqual(transfer.log.error.call_args[0][1], host)
+
+        # cleanup
+        transfer = m_transfer.Transfer(**self.transfer_conf)
+
+        # --------------------------------------------------------------------
+        # whitelist: allowing host fails
+        # --------------------------------------------------------------------
+        transfer.log = mock.MagicMock()
+
+        m_auth = "hidra.transfer.ThreadAuthenticator"
+        with mock.patch("socket.gethostbyaddr") as mock_gethostbyaddr:
+            with mock.patch(m_auth) as mock_auth:
+                mock_gethostbyaddr.return_value = (host, [], ["test_ip"])
+                mock_auth.return_value.allow.side_effect = TestException()
+
+                with self.assertRaises(m_transfer.AuthenticationFailed):
+                    transfer.register(whitelist)
+
+                mock_auth.return_value.allow.assert_called_once_with(
+                    "test_ip"
+                )
+
+        # cleanup
+        transfer = m_transfer.Transfer(**self.transfer_conf)
+
+    def test_read(self):
+        self.transfer_conf["connection_type"] = "NEXUS"
+        transfer = m_transfer.Transfer(**self.transfer_conf)
+
+        # --------------------------------------------------------------------
+        # session not started
+        # --------------------------------------------------------------------
+        with self.assertRaises(m_transfer.UsageError):
+            transfer.read(callback_params=None,
+                          open_callback=None,
+                          read_callback=None,
+                          close_callback=None)
+
+        # --------------------------------------------------------------------
+        # buffer given, pyzmq does not support recv_into
+        # --------------------------------------------------------------------
+        transfer.started_connections = {"NEXUS": None}
+        transfer.data_socket = mock.MagicMock(
+            spec=["recv", "recv_multipart", "getsockopt"]
+        )
+        transfer.poller = MockZmqPollerAllFake()
+
+        with self.assertRaises(m_transfer.NotSupported):
+            transfer.read(callback_params=None,
+                          open_callback=None,
+                          read_callback=None,
+                          close_callback=None,
+                          buffer=bytearray(10))
+
+        self.assertFalse(transfer.poller.poll.called)
+
+        # --------------------------------------------------------------------
+        # buffer given, pyzmq supports recv_into
+        # --------------------------------------------------------------------
+        transfer.data_socket = MockZmqSocket()
+        transfer.poller.poll.side_effect = TestException()
+
+        # the guard passes and the read loop is entered
+        with self.assertRaises(TestException):
+            transfer.read(callback_params=None,
+                          open_callback=None,
+                          read_callback=None,
+                          close_callback=None,
+                          buffer=bytearray(10))
+
+        # --------------------------------------------------------------------
+        # batch was full, next batch is read without polling
+        # --------------------------------------------------------------------
+        transfer.data_socket = MockZmqSocket()
+        transfer.poller = MockZmqPollerAllFake()
+        transfer.poller.poll.return_value = [
+            (transfer.data_socket, zmq.POLLIN)
+        ]
+        read_flags = []
+
+        def read_data(buffer=None, flags=0):
+            # pylint: disable=unused-argument
+            read_flags.append(flags)
+            # first batch is full, the second one closes the file
+            transfer._data_pending = len(read_flags) == 1
+            return len(read_flags) < 2
+
+        with mock.patch.object(transfer, "_read_data") as mock_read_data:
+            mock_read_data.side_effect = read_data
+
+            transfer.read(callback_params=None,
+                          open_callback=None,
+                          read_callback=None,
+                          close_callback=None)
+
+        self.assertEqual(transfer.poller.poll.call_count, 1)
+        self.assertEqual(read_flags, [0, zmq.NOBLOCK])
+
+        # cleanup
+        transfer.data_socket = None
+        transfer.started_connections = {}
+
+    def test__read_data(self):
+        self.transfer_conf["connection_type"] = "NEXUS"
+        transfer = m_transfer.Transfer(**self.transfer_conf)
+        transfer.log = mock.MagicMock()
+        transfer.read_callback = mock.MagicMock()
+
+        def data_message(*args, **kwargs):
+            # pylint: disable=unused-argument
+            return [zmq.Frame(b'{"filename": "test_file"}'),
+                    zmq.Frame(b"payload")]
+
+        # --------------------------------------------------------------------
+        # more messages queued than the batch size
+        # --------------------------------------------------------------------
+        transfer.data_socket = MockZmqSocket()
+        transfer.data_socket.recv_multipart.side_effect = data_message
+
+        ret_val = transfer._read_data()
+
+        self.assertTrue(ret_val)
+        self.assertTrue(transfer._data_pending)
+        self.assertEqual(transfer.read_batch_size, 256)
+        self.assertEqual(transfer.data_socket.recv_multipart.call_count, 256)
+        self.assertEqual(transfer.read_callback.call_count, 256)
+
+        # only the first message is announced by the poller
+        calls = transfer.data_socket.recv_multipart.call_args_list
+        self.assertEqual(calls[0], mock.call(flags=0, copy=False))
+        self.assertEqual(calls[1], mock.call(flags=zmq.NOBLOCK, copy=False))
+        self.assertEqual(calls[-1], mock.call(flags=zmq.NOBLOCK, copy=False))
+
+        # --------------------------------------------------------------------
+        # less messages queued than the batch size
+        # --------------------------------------------------------------------
+        transfer.read_batch_size = 3
+        transfer.read_callback = mock.MagicMock()
+        transfer.data_socket = MockZmqSocket()
+        transfer.data_socket.recv_multipart.side_effect = [
+            data_message(), data_message(), zmq.Again()
+        ]
+
+        ret_val = transfer._read_data()
+
+        self.assertTrue(ret_val)
+        self.assertFalse(transfer._data_pending)
+        self.assertEqual(transfer.read_callback.call_count, 2)
+
+        # --------------------------------------------------------------------
+        # batch size reached, no further messages taken
+        # --------------------------------------------------------------------
+        transfer.read_callback = mock.MagicMock()
+        transfer.data_socket = MockZmqSocket()
+        transfer.data_socket.recv_multipart.side_effect = data_message
+
+        ret_val = transfer._read_data(flags=zmq.NOBLOCK)
+
+        self.assertTrue(ret_val)
+        self.assertTrue(transfer._data_pending)
+        self.assertEqual(transfer.data_socket.recv_multipart.call_count, 3)
+        self.assertEqual(transfer.read_callback.call_count, 3)
+
+        # --------------------------------------------------------------------
+        # file closed within the batch
+        # --------------------------------------------------------------------
+        transfer.read_callback = mock.MagicMock()
+        transfer.data_socket = MockZmqSocket()
+        transfer.data_socket.recv_multipart.side_effect = data_message
+
+        with mock.patch.object(transfer, "_react_on_message") as mock_react:
+            mock_react.side_effect = [True, False]
+
+            ret_val = transfer._read_data()
+
+        self.assertFalse(ret_val)
+        self.assertFalse(transfer._data_pending)
+        self.assertEqual(transfer.data_socket.recv_multipart.call_count, 2)
+
         # cleanup
+        transfer.data_socket = None
+
+    def test__recv_data_message(self):
+        self.transfer_conf["connection_type"] = "NEXUS"
         transfer = m_transfer.Transfer(**self.transfer_conf)
+        transfer.log = mock.MagicMock()
+        transfer.data_socket = MockZmqSocket()
+
+        header = zmq.Frame(b'{"filename": "test_file"}')
+
+        # --------------------------------------------------------------------
+        # no buffer
+        # --------------------------------------------------------------------
+        message = [header, zmq.Frame(b"payload")]
+        transfer.data_socket.recv_multipart.return_value = message
+
+        ret_val = transfer._recv_data_message(flags=zmq.NOBLOCK)
+
+        self.assertEqual(ret_val, message)
+        transfer.data_socket.recv_multipart.assert_called_once_with(
+            flags=zmq.NOBLOCK, copy=False
+        )
+        self.assertFalse(transfer.data_socket.recv_into.called)
+
+        # --------------------------------------------------------------------
+        # buffer, single frame message
+        # --------------------------------------------------------------------
+        transfer.data_socket = MockZmqSocket()
+        transfer.data_socket.recv.return_value = header
+        transfer.data_socket.getsockopt.return_value = 0
+
+        ret_val = transfer._recv_data_message(buffer=bytearray(10))
 
-    def todo_test_read(self):
-        pass
+        self.assertEqual(ret_val, [header])
+        self.assertFalse(transfer.data_socket.recv_into.called)
+
+        # --------------------------------------------------------------------
+        # buffer, signal message
+        # --------------------------------------------------------------------
+        transfer.data_socket = MockZmqSocket()
+        transfer.data_socket.recv.return_value = zmq.Frame(b"CLOSE_FILE")
+        transfer.data_socket.getsockopt.return_value = 1
+        transfer.data_socket.recv_multipart.return_value = [
+            zmq.Frame(b"test_file"), zmq.Frame(b"0/1")
+        ]
+
+        ret_val = transfer._recv_data_message(buffer=bytearray(10))
+
+        self.assertEqual([frame.bytes for frame in ret_val],
+                         [b"CLOSE_FILE", b"test_file", b"0/1"])
+        self.assertFalse(transfer.data_socket.recv_into.called)
+
+        # --------------------------------------------------------------------
+        # buffer, payload fits
+        # --------------------------------------------------------------------
+        buffer = bytearray(10)
+
+        def recv_into(buf):
+            buf[:7] = b"payload"
+            return 7
+
+        transfer.data_socket = MockZmqSocket()
+        transfer.data_socket.recv.return_value = header
+        transfer.data_socket.getsockopt.side_effect = [1, 0]
+        transfer.data_socket.recv_into.side_effect = recv_into
+
+        ret_val = transfer._recv_data_message(buffer=buffer)
+
+        self.assertEqual(len(ret_val), 2)
+        self.assertIs(ret_val[0], header)
+        self.assertIsInstance(ret_val[1], memoryview)
+        # the view is trimmed to the received size
+        self.assertEqual(len(ret_val[1]), 7)
+        self.assertEqual(ret_val[1].tobytes(), b"payload")
+        transfer.data_socket.recv_into.assert_called_once_with(buffer)
+
+        # --------------------------------------------------------------------
+        # buffer, payload larger than the buffer
+        # --------------------------------------------------------------------
+        transfer.data_socket = MockZmqSocket()
+        transfer.data_socket.recv.return_value = header
+        transfer.data_socket.getsockopt.side_effect = [1, 0]
+        transfer.data_socket.recv_into.return_value = 20
 
-    def todo_test__react_on_message(self):
-        pass
+        with self.assertRaises(m_transfer.DataError):
+            transfer._recv_data_message(buffer=bytearray(10))
+
+        # --------------------------------------------------------------------
+        # buffer too small, error is not swallowed by _read_data
+        # --------------------------------------------------------------------
+        transfer.data_socket = MockZmqSocket()
+        transfer.data_socket.recv.return_value = header
+        transfer.data_socket.getsockopt.side_effect = [1, 0]
+        transfer.data_socket.recv_into.return_value = 20
+        transfer.read_callback = mock.MagicMock()
+
+        with self.assertRaises(m_transfer.DataError):
+            transfer._read_data(buffer=bytearray(10))
+
+        self.assertFalse(transfer.read_callback.called)
+
+        # cleanup
+        transfer.data_socket = None
+
+    def test__react_on_message(self):
+        self.transfer_conf["connection_type"] = "NEXUS"
+        transfer = m_transfer.Transfer(**self.transfer_conf)
+        transfer.log = mock.MagicMock()
+        transfer.status_check_socket = MockZmqSocket()
+        transfer.close_callback = mock.MagicMock()
+
+        def close_message(file_id):
+            return [zmq.Frame(b"CLOSE_FILE"),
+                    zmq.Frame(b"test_file"),
+                    zmq.Frame(file_id)]
+
+        # --------------------------------------------------------------------
+        # close id is missing
+        # --------------------------------------------------------------------
+        message = [zmq.Frame(b"CLOSE_FILE"), zmq.Frame(b"test_file")]
+
+        with self.assertRaises(m_transfer.DataError):
+            transfer._react_on_message(message)
+
+        # --------------------------------------------------------------------
+        # first close signal, id is parsed
+        # --------------------------------------------------------------------
+        ret_val = transfer._react_on_message(close_message(b"0/2"))
+
+        self.assertTrue(ret_val)
+        self.assertEqual(transfer.number_of_streams, 2)
+        self.assertEqual(transfer.all_close_mask, 0b11)
+        self.assertEqual(transfer.close_bits, {b"0/2": 0b01})
+        self.assertEqual(transfer.recvd_close_mask, 0b01)
+        self.assertFalse(transfer.all_close_recvd)
+
+        # --------------------------------------------------------------------
+        # duplicate close signal
+        # --------------------------------------------------------------------
+        ret_val = transfer._react_on_message(close_message(b"0/2"))
+
+        self.assertTrue(ret_val)
+        self.assertEqual(transfer.recvd_close_mask, 0b01)
+        self.assertFalse(transfer.all_close_recvd)
+
+        # --------------------------------------------------------------------
+        # all close signals arrived before the reply was requested
+        # --------------------------------------------------------------------
+        ret_val = transfer._react_on_message(close_message(b"1/2"))
+
+        self.assertTrue(ret_val)
+        self.assertEqual(transfer.close_bits, {b"0/2": 0b01, b"1/2": 0b10})
+        self.assertEqual(transfer.recvd_close_mask, 0b11)
+        self.assertTrue(transfer.all_close_recvd)
+        self.assertFalse(transfer.status_check_socket.send_multipart.called)
+        self.assertFalse(transfer.close_callback.called)
+
+        # --------------------------------------------------------------------
+        # all close signals arrived after the reply was requested
+        # --------------------------------------------------------------------
+        transfer.all_close_recvd = False
+        transfer.recvd_close_mask = 0
+        reply = [b"CLOSE_FILE", b"test_file"]
+        transfer.reply_to_signal = reply
+
+        ret_val = transfer._react_on_message(close_message(b"1/2"))
+        self.assertTrue(ret_val)
+        self.assertFalse(transfer.close_callback.called)
+
+        ret_val = transfer._react_on_message(close_message(b"0/2"))
+
+        self.assertFalse(ret_val)
+        transfer.status_check_socket.send_multipart.assert_called_once_with(
+            reply
+        )
+        self.assertTrue(transfer.close_callback.called)
+        # the mask is reset for the next file
+        self.assertEqual(transfer.recvd_close_mask, 0)
+        self.assertFalse(transfer.reply_to_signal)
+
+        # cleanup
+        transfer.status_check_socket = None
+
+    def test__decompress_payload(self):
+        self.transfer_conf["connection_type"] = "NEXUS"
+        transfer = m_transfer.Transfer(**self.transfer_conf)
+        transfer.log = mock.MagicMock()
+        transfer.read_callback = mock.MagicMock()
+
+        metadata = {"filename": "test_file", "compression": "blosc"}
+        message = [zmq.Frame(json.dumps(metadata).encode("utf-8")),
+                   zmq.Frame(b"compressed")]
+
+        # --------------------------------------------------------------------
+        # blosc compressed payload
+        # --------------------------------------------------------------------
+        with mock.patch("hidra.transfer.blosc") as mock_blosc:
+            mock_blosc.decompress.return_value = b"decompressed"
+
+            transfer._react_on_message(message)
+
+            self.assertEqual(
+                bytes(mock_blosc.decompress.call_args[0][0]), b"compressed"
+            )
+
+        self.assertTrue(transfer.read_callback.called)
+        [recvd_metadata, payload] = transfer.read_callback.call_args[0][1]
+        self.assertEqual(recvd_metadata, metadata)
+        self.assertIsInstance(payload, memoryview)
+        self.assertEqual(payload.tobytes(), b"decompressed")
+
+        # --------------------------------------------------------------------
+        # blosc not installed
+        # --------------------------------------------------------------------
+        transfer.read_callback = mock.MagicMock()
+
+        with mock.patch("hidra.transfer.blosc", None):
+            with self.assertRaises(m_transfer.NotSupported):
+                transfer._react_on_message(message)
+
+        self.assertFalse(transfer.read_callback.called)
+
+        # --------------------------------------------------------------------
+        # blosc not installed, error reaches the caller of read
+        # --------------------------------------------------------------------
+        transfer.started_connections = {"NEXUS": None}
+        transfer.data_socket = MockZmqSocket()
+        transfer.data_socket.recv_multipart.return_value = message
+        transfer.poller = MockZmqPollerAllFake()
+        transfer.poller.poll.return_value = [
+            (transfer.data_socket, zmq.POLLIN)
+        ]
+        read_callback = mock.MagicMock()
+
+        with mock.patch("hidra.transfer.blosc", None):
+            with self.assertRaises(m_transfer.NotSupported):
+                transfer.read(callback_params=None,
+                              open_callback=None,
+                              read_callback=read_callback,
+                              close_callback=None)
+
+        self.assertFalse(read_callback.called)
+        self.assertEqual(transfer.data_socket.recv_multipart.call_count, 1)
+
+        # cleanup
+        transfer.data_socket = None
+        transfer.started_connections = {}
 
     @mock.patch("hidra.transfer.Transfer.stop")
     def test_get_chunk(self, mock_stop):
@@ -1589,9 +2069,9 @@ class TestTransfer(TestBase):
             b"STATUS_CHECK"
         ]
         transfer.poller = MockZmqPollerAllFake()
-        transfer.poller.poll.return_value = {
-            transfer.status_check_socket: zmq.POLLIN
-        }
+        transfer.poller.poll.return_value = [
+            (transfer.status_check_socket, zmq.POLLIN)
+        ]
 
         transfer.get_chunk()
 
@@ -1610,9 +2090,9 @@ class TestTransfer(TestBase):
             b"RESET_STATUS"
         ]
         transfer.poller = MockZmqPollerAllFake()
-        transfer.poller.poll.return_value = {
-            transfer.status_check_socket: zmq.POLLIN
-        }
+        transfer.poller.poll.return_value = [
+            (transfer.status_check_socket, zmq.POLLIN)
+        ]
         transfer.status = "foo"
 
         transfer.get_chunk()
@@ -1633,9 +2113,9 @@ class TestTransfer(TestBase):
             b"foo"
         ]
         transfer.poller = MockZmqPollerAllFake()
-        transfer.poller.poll.return_value = {
-            transfer.status_check_socket: zmq.POLLIN
-        }
+        transfer.poller.poll.return_value = [
+            (transfer.status_check_socket, zmq.POLLIN)
+        ]
 
         transfer.get_chunk()
 
@@ -1655,9 +2135,9 @@ class TestTransfer(TestBase):
         transfer.data_socket = MockZmqSocket()
         transfer.data_socket.recv_multipart.side_effect = Exception()
         transfer.poller = MockZmqPollerAllFake()
-        transfer.poller.poll.return_value = {
-            transfer.data_socket: zmq.POLLIN
-        }
+        transfer.poller.poll.return_value = [
+            (transfer.data_socket, zmq.POLLIN)
+        ]
 
         ret_val = transfer.get_chunk()
 
@@ -1678,9 +2158,9 @@ class TestTransfer(TestBase):
             b"ALIVE_TEST"
         ]
         transfer.poller = MockZmqPollerAllFake()
-        transfer.poller.poll.return_value = {
-            transfer.data_socket: zmq.POLLIN
-        }
+        transfer.poller.poll.return_value = [
+            (transfer.data_socket, zmq.POLLIN)
+        ]
 
         timeout = -1
         ret_val = transfer.get_chunk(timeout)
@@ -1700,12 +2180,12 @@ class TestTransfer(TestBase):
             b"ALIVE_TEST"
         ]
         transfer.poller = MockZmqPollerAllFake()
-        transfer.poller.poll.return_value = {
-            transfer.data_socket: zmq.POLLIN
-        }
+        transfer.poller.poll.return_value = [
+            (transfer.data_socket, zmq.POLLIN)
+        ]
 
         timeout = 1
-        with mock.patch("time.time") as mock_time:
+        with mock.patch("hidra.transfer._monotonic") as mock_time:
             # The side effect values have to be different from each other,
             # otherwise the difference becomes 0
             mock_time.side_effect = [1, 2]
@@ -1727,9 +2207,9 @@ class TestTransfer(TestBase):
         transfer.data_socket = MockZmqSocket()
         transfer.data_socket.recv_multipart.return_value = [b"foo"]
         transfer.poller = MockZmqPollerAllFake()
-        transfer.poller.poll.return_value = {
-            transfer.data_socket: zmq.POLLIN
-        }
+        transfer.poller.poll.return_value = [
+            (transfer.data_socket, zmq.POLLIN)
+        ]
 
         ret_val = transfer.get_chunk()
 
@@ -1752,13 +2232,100 @@ class TestTransfer(TestBase):
             "bar"
         ]
         transfer.poller = MockZmqPollerAllFake()
-        transfer.poller.poll.return_value = {
-            transfer.data_socket: zmq.POLLIN
-        }
+        transfer.poller.poll.return_value = [
+            (transfer.data_socket, zmq.POLLIN)
+        ]
+
+        ret_val = transfer.get_chunk()
+
+        self.assertEqual(ret_val, [metadata, "bar"])
+        self.assertTrue(transfer._data_pending)
+
+        # --------------------------------------------------------------------
+        # data: message already queued, no polling
+        # --------------------------------------------------------------------
+
+        transfer.poller = MockZmqPollerAllFake()
+        transfer.poller.poll.return_value = []
 
         ret_val = transfer.get_chunk()
 
         self.assertEqual(ret_val, [metadata, "bar"])
+        self.assertFalse(transfer.poller.poll.called)
+        transfer.data_socket.recv_multipart.assert_called_with(
+            flags=zmq.NOBLOCK, copy=True
+        )
+
+        # --------------------------------------------------------------------
+        # data: no message queued, fall back to polling
+        # --------------------------------------------------------------------
+
+        transfer.data_socket.recv_multipart.side_effect = zmq.Again()
+
+        ret_val = transfer.get_chunk()
+
+        self.assertEqual(ret_val, [None, None])
+        self.assertTrue(transfer.poller.poll.called)
+        self.assertFalse(transfer._data_pending)
+
+        # cleanup
+        transfer = m_transfer.Transfer(**self.transfer_conf)
+
+        # --------------------------------------------------------------------
+        # data: query, reply is always polled for
+        # --------------------------------------------------------------------
+
+        transfer.started_connections = {"QUERY_NEXT": {"id": b"0"}}
+        transfer.request_socket = MockZmqSocket()
+        transfer.data_socket = MockZmqSocket()
+        transfer.data_socket.recv_multipart.return_value = [
+            json.dumps(metadata).encode("utf-8"),
+            "bar"
+        ]
+        transfer.poller = MockZmqPollerAllFake()
+        transfer.poller.poll.return_value = [
+            (transfer.data_socket, zmq.POLLIN)
+        ]
+
+        ret_val = transfer.get_chunk()
+
+        self.assertEqual(ret_val, [metadata, "bar"])
+        self.assertFalse(transfer._data_pending)
+
+        ret_val = transfer.get_chunk()
+
+        self.assertEqual(ret_val, [metadata, "bar"])
+        self.assertEqual(transfer.poller.poll.call_count, 2)
+        transfer.data_socket.recv_multipart.assert_called_with(copy=True)
+
+        # cleanup
+        transfer.request_socket = None
+        transfer = m_transfer.Transfer(**self.transfer_conf)
+
+        # --------------------------------------------------------------------
+        # data: message ok, no copy
+        # --------------------------------------------------------------------
+
+        transfer.started_connections = {"STREAM": None}
+        transfer.data_socket = MockZmqSocket()
+        metadata = {"foo": None}
+        transfer.data_socket.recv_multipart.return_value = [
+            zmq.Frame(json.dumps(metadata).encode("utf-8")),
+            zmq.Frame(b"bar")
+        ]
+        transfer.poller = MockZmqPollerAllFake()
+        transfer.poller.poll.return_value = [
+            (transfer.data_socket, zmq.POLLIN)
+        ]
+
+        ret_val = transfer.get_chunk(copy=False)
+
+        transfer.data_socket.recv_multipart.assert_called_once_with(
+            copy=False
+        )
+        self.assertEqual(ret_val[0], metadata)
+        self.assertIsInstance(ret_val[1], memoryview)
+        self.assertEqual(ret_val[1].tobytes(), b"bar")
 
         # cleanup
         transfer = m_transfer.Transfer(**self.transfer_conf)
@@ -1775,9 +2342,9 @@ class TestTransfer(TestBase):
             "bar"
         ]
         transfer.poller = MockZmqPollerAllFake()
-        transfer.poller.poll.return_value = {
-            transfer.data_socket: zmq.POLLIN
-        }
+        transfer.poller.poll.return_value = [
+            (transfer.data_socket, zmq.POLLIN)
+        ]
 
         ret_val = transfer.get_chunk()
 
@@ -1794,7 +2361,7 @@ class TestTransfer(TestBase):
         # --------------------------------------------------------------------
 
         transfer.poller = MockZmqPollerAllFake()
-        transfer.poller.poll.return_value = {}
+        transfer.poller.poll.return_value = []
         transfer.started_connections = {"STREAM": None}
         transfer.request_socket = MockZmqSocket()
 
@@ -1810,7 +2377,7 @@ class TestTransfer(TestBase):
         # --------------------------------------------------------------------
 
         transfer.poller = MockZmqPollerAllFake()
-        transfer.poller.poll.return_value = {}
+        transfer.poller.poll.return_value = []
         transfer.request_socket = MockZmqSocket()
         transfer.started_connections = {
             "QUERY_NEXT": {
@@ -1838,7 +2405,7 @@ class TestTransfer(TestBase):
 
         transfer.log = mock.MagicMock()
         transfer.poller = MockZmqPollerAllFake()
-        transfer.poller.poll.return_value = {}
+        transfer.poller.poll.return_value = []
         transfer.request_socket = MockZmqSocket()
         transfer.request_socket.send_multipart.side_effect = [None,
                                                               TestException()]
@@ -36,6 +36,8 @@ import time
 import logging
 from shutil import copyfile
 
+import hidra.utils as utils
+
 from eventdetectors.inotifyx_events import EventDetector
 from .eventdetector_test_base import EventDetectorTestBase, create_dir
 
@@ -132,6 +134,19 @@ class TestEventDetector(EventDetectorTestBase):
                 self.log.debug("event_list %s", event_list)
                 raise
 
+    def test_wrong_monitored_event(self):
+        """Monitored events which are no inotify events are rejected.
+        """
+
+        self.config_module["monitored_events"] = {
+            "IN_NOT_EXISTING": [".tif"]
+        }
+
+        create_dir(self.target_file_base)
+
+        with self.assertRaises(utils.WrongConfiguration):
+            self._start_eventdetector()
+
     # this should not be executed automatically only if needed for debugging
     @unittest.skip("Only needed for debugging")
     def test_memory_usage(self):